@@ -1,32 +1,178 @@
 """Command-line entry point for MongoDB Backup Wizard."""
 
+import argparse
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
-import questionary
 from pymongo import MongoClient
 from dotenv import load_dotenv
 
-from .ui.wizard import run_backup_wizard, run_restore_wizard
+from .core.backup import (backup_all_collections, backup_collection,
+                          backup_collection_mongodump, get_collections_info)
+from .core.restore import restore_all, restore_collection, write_manifest, RestoreError
+from .ui.wizard import run_backup_wizard, run_restore_wizard, get_backups_dir, record_backup_summary
 from rich.console import Console
 
 console = Console()
 
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for scripted (non-interactive) usage."""
+    parser = argparse.ArgumentParser(
+        prog="mongowiz",
+        description="Backup and restore MongoDB collections. "
+                    "Run without arguments for the interactive wizard."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    backup_parser = subparsers.add_parser(
+        "backup", help="Backup collections without prompts")
+    backup_parser.add_argument("--db", help="Database name")
+    backup_parser.add_argument("--collection", help="Collection name")
+    backup_parser.add_argument("--backup-dir", type=Path, default=None,
+                               help="Backup directory (default: timestamped folder under ./backups)")
+    backup_parser.add_argument("--all", action="store_true",
+                               help="Backup every non-system collection")
+    backup_parser.add_argument("--workers", type=int, default=None,
+                               help="Worker threads within a collection, or worker "
+                                    "processes across collections with --all "
+                                    "(default: 1, or CPU count with --all)")
+    backup_parser.add_argument("--batch-size", type=int, default=None,
+                               help="Documents per cursor batch (default: tuned "
+                                    "from the collection's average document size)")
+    backup_parser.add_argument("--format", choices=("json", "bson"), default="json",
+                               dest="output_format", help="Backup file format (default: json)")
+    backup_parser.add_argument("--compress", action="store_true",
+                               help="Compress backup files with zstd")
+    backup_parser.add_argument("--mongodump", action="store_true",
+                               help="Shell out to mongodump (raw BSON, fastest; "
+                                    "requires the binary on PATH)")
+
+    restore_parser = subparsers.add_parser(
+        "restore", help="Restore a collection without prompts")
+    restore_parser.add_argument("--db", help="Database name")
+    restore_parser.add_argument("--collection", help="Collection name")
+    restore_parser.add_argument("--backup-dir", type=Path, required=True,
+                                help="Backup directory to restore from")
+    restore_parser.add_argument("--all", action="store_true",
+                                help="Restore every collection in the backup")
+    restore_parser.add_argument("--force", action="store_true",
+                                help="Overwrite collections that already exist")
+    restore_parser.add_argument("--workers", type=int, default=None,
+                                help="Worker processes for --all (default: CPU count)")
+    restore_parser.add_argument("--unacknowledged", action="store_true",
+                                help="Insert with write concern w=0 (faster; trades "
+                                     "per-write durability acknowledgments)")
+
+    return parser
+
+def run_backup_cli(client, args, mongodb_url: str = None) -> int:
+    """Run a scripted backup; returns a process exit code."""
+    backup_dir = args.backup_dir
+    if backup_dir is None:
+        backup_dir = get_backups_dir() / f"mongodb_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+    if args.all:
+        collections_info = get_collections_info(client)
+        targets = [
+            (db_name, coll_name)
+            for db_name, collections in collections_info.items()
+            for coll_name, _, _ in collections
+        ]
+        if not targets:
+            console.print("[red]No collections found to backup[/red]")
+            return 1
+    elif args.db and args.collection:
+        targets = [(args.db, args.collection)]
+    else:
+        console.print("[red]Specify --db and --collection, or --all[/red]")
+        return 2
+
+    if args.all and not args.mongodump:
+        # One worker process per collection: independent cursors scale
+        # near-linearly and each process opens its own client
+        console.print(f"Backing up {len(targets)} collections to {backup_dir}")
+        if not backup_all_collections(mongodb_url, collections_info, backup_dir,
+                                      workers=args.workers,
+                                      output_format=args.output_format,
+                                      compress=args.compress):
+            console.print("[red]Backup failed for some collections[/red]")
+            return 1
+    else:
+        failed = []
+        for db_name, coll_name in targets:
+            console.print(f"Backing up {db_name}.{coll_name} to {backup_dir}")
+            if args.mongodump:
+                ok = backup_collection_mongodump(mongodb_url, db_name, coll_name, backup_dir)
+            else:
+                ok = backup_collection(client, db_name, coll_name, backup_dir,
+                                       batch_size=args.batch_size,
+                                       output_format=args.output_format,
+                                       compress=args.compress,
+                                       workers=args.workers or 1)
+            if not ok:
+                failed.append(f"{db_name}.{coll_name}")
+
+        if failed:
+            console.print(f"[red]Backup failed for: {', '.join(failed)}[/red]")
+            return 1
+    write_manifest(backup_dir)
+    record_backup_summary(backup_dir)
+    console.print("[green]Backup completed successfully![/green]")
+    return 0
+
+def run_restore_cli(client, args, mongodb_url: str = None) -> int:
+    """Run a scripted restore; returns a process exit code."""
+    if args.all:
+        console.print(f"Restoring all collections from {args.backup_dir}")
+        ok = restore_all(mongodb_url, args.backup_dir, force=args.force,
+                         workers=args.workers,
+                         acknowledged=not args.unacknowledged)
+    elif args.db and args.collection:
+        console.print(f"Restoring {args.db}.{args.collection} from {args.backup_dir}")
+        try:
+            ok = restore_collection(client, args.backup_dir, args.db, args.collection,
+                                    force=args.force,
+                                    acknowledged=not args.unacknowledged)
+        except RestoreError as e:
+            console.print(f"[red]{e}[/red]")
+            return 1
+    else:
+        console.print("[red]Specify --db and --collection, or --all[/red]")
+        return 2
+
+    if not ok:
+        console.print("[red]Restore failed![/red]")
+        return 1
+    console.print("[green]Restore completed successfully![/green]")
+    return 0
+
 def main():
     """Main entry point for the MongoDB Backup Wizard."""
+    args = build_parser().parse_args()
+
     # Load environment variables
     load_dotenv()
-    
+
     # Get MongoDB connection
     mongodb_url = os.getenv("MONGODB_URL")
     if not mongodb_url:
         console.print("[red]Error: MONGODB_URL environment variable not set[/red]")
         sys.exit(1)
-    
+
+    client = None
     try:
         client = MongoClient(mongodb_url)
-        
-        # Ask user what they want to do
+
+        if args.command == "backup":
+            sys.exit(run_backup_cli(client, args, mongodb_url))
+        elif args.command == "restore":
+            sys.exit(run_restore_cli(client, args, mongodb_url))
+
+        # No subcommand: interactive wizard (questionary imports lazily;
+        # scripted runs never pay for prompt_toolkit)
+        import questionary
+
         action = questionary.select(
             "What would you like to do?",
             choices=[
@@ -35,17 +181,18 @@ def main():
                 {"name": "Exit", "value": "exit"}
             ]
         ).ask()
-        
+
         if action == "backup":
             run_backup_wizard(client)
         elif action == "restore":
             run_restore_wizard(client)
-            
+
     except Exception as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         sys.exit(1)
     finally:
-        client.close()
+        if client is not None:
+            client.close()
 
 if __name__ == "__main__":
     main()
@@ -2,128 +2,250 @@
 
 import json
 import logging
+import math
+import os
+import shutil
+import subprocess
 import time
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, List, Tuple
 from tqdm import tqdm
 
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure, OperationFailure
-from bson import ObjectId
+from bson import json_util
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
 
 logger = logging.getLogger(__name__)
 
-def json_serialize(obj):
-    """Custom JSON serializer for handling MongoDB specific types."""
+# Backups are written as relaxed MongoDB Extended JSON ({"$oid": ...},
+# {"$date": ...}), one document per line (JSON Lines), so files round-trip
+# through bson.json_util and standard MongoDB tooling without a hand-rolled
+# type-tagging scheme and need no array framing around the documents.
+JSON_OPTIONS = json_util.RELAXED_JSON_OPTIONS
+
+# Buffer size for backup file writes. Documents are written through a single
+# buffered handle; a large buffer batches many small writes into one syscall.
+WRITE_BUFFER_SIZE = 4 << 20
+
+def _bson_default(obj):
+    """orjson default hook mapping MongoDB-specific types to Extended JSON."""
     try:
-        if obj is None:
-            return None
-        if isinstance(obj, datetime):
-            return {"$type": "datetime", "$value": obj.isoformat()}
-        if isinstance(obj, ObjectId):
-            return {"$type": "ObjectId", "$value": str(obj)}
-        if isinstance(obj, (bytes, bytearray)):
-            return str(obj)
-        return obj
+        return json_util.default(obj, json_options=JSON_OPTIONS)
+    except TypeError:
+        # Types bson's encoder doesn't know about degrade to their repr
+        return str(obj)
+
+def _has_nonfinite(value) -> bool:
+    """True if any float anywhere in the document is NaN or +/-Infinity."""
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, float):
+            if not math.isfinite(node):
+                return True
+        elif isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return False
+
+def encode_document(doc) -> bytes:
+    """Encode a single document to relaxed Extended JSON bytes.
+
+    orjson encodes native types at C speed and only calls into
+    bson.json_util for MongoDB-specific ones (datetime is routed there via
+    OPT_PASSTHROUGH_DATETIME). Without orjson the whole document goes
+    through json_util.dumps instead.
+
+    orjson has no passthrough for floats and flattens NaN/Infinity to
+    null, which would corrupt the backup. Only output containing 'null'
+    can be affected, so those documents (and only those) are screened and
+    re-encoded through json_util, which writes {"$numberDouble": "NaN"}
+    like the fallback path.
+    """
+    if orjson is not None:
+        data = orjson.dumps(doc, default=_bson_default,
+                            option=orjson.OPT_PASSTHROUGH_DATETIME)
+        if b'null' not in data or not _has_nonfinite(doc):
+            return data
+    return json_util.dumps(doc, json_options=JSON_OPTIONS).encode('utf-8')
+
+def _write_meta(backup_path: Path, collection_name: str, count: int, backup_file: Path) -> None:
+    """Write a .meta.json sidecar next to a finished backup file.
+
+    Restore-side listings read the document count from the sidecar instead
+    of parsing the whole backup. Best effort: a failed sidecar write never
+    fails the backup itself.
+    """
+    try:
+        meta = {'count': count, 'bytes': backup_file.stat().st_size}
+        with open(backup_path / f"{collection_name}.meta.json", 'w') as f:
+            json.dump(meta, f)
     except Exception as e:
-        logger.error(f"Error serializing object of type {type(obj)}: {str(e)}")
+        logger.warning(f"Could not write meta sidecar for {collection_name}: {e}")
+
+def _collection_stats(db, coll_name: str):
+    """Fetch (collection_name, doc_count, size) via a $collStats aggregation.
+
+    Returns None for collections we can't access.
+    """
+    try:
+        stats = next(db[coll_name].aggregate([
+            {"$collStats": {"storageStats": {"scale": 1}}}
+        ]))
+        storage = stats.get('storageStats', {})
+        return (coll_name, storage.get('count', 0), storage.get('size', 0))
+    except Exception:
         return None
 
-def process_document(doc):
-    """Process a single document, handling None values and serialization."""
-    if doc is None:
-        return {}
-    
+# Cursor batch autotuning targets ~1 MB per getMore reply: big enough to
+# amortize round-trips, small enough to bound per-batch memory. The bounds
+# stop tiny documents from ballooning batches and huge ones from degrading
+# to the server's 101-document default.
+_CURSOR_BATCH_TARGET_BYTES = 1_000_000
+_MIN_CURSOR_BATCH = 100
+_MAX_CURSOR_BATCH = 10000
+_MIN_AVG_DOC_BYTES = 200
+
+def _tuned_cursor_batch(collection) -> int:
+    """Pick a cursor batch_size from the collection's average document size.
+
+    Reads count and uncompressed size from $collStats; collections we can't
+    stat (or empty ones) get the upper bound, which is the right call for
+    the small documents that dominate when no signal is available.
+    """
     try:
-        processed = {}
-        if not hasattr(doc, 'items'):
-            logger.error(f"Document is not a dictionary: {type(doc)}")
-            return {}
-            
-        for k, v in doc.items():
-            try:
-                if isinstance(v, dict):
-                    processed[k] = process_document(v)
-                elif isinstance(v, list):
-                    processed[k] = [
-                        process_document(item) if isinstance(item, dict)
-                        else json_serialize(item)
-                        for item in v
-                    ]
-                else:
-                    processed[k] = json_serialize(v)
-            except Exception as e:
-                logger.error(f"Error processing field {k}: {str(e)}")
-                processed[k] = None
-        return processed
-    except Exception as e:
-        logger.error(f"Error in process_document: {str(e)}")
-        return {}
+        stats = next(collection.aggregate([
+            {"$collStats": {"storageStats": {"scale": 1}}}
+        ]))
+        storage = stats.get('storageStats', {})
+        count = storage.get('count', 0)
+        size = storage.get('size', 0)
+    except Exception:
+        return _MAX_CURSOR_BATCH
+    if not count:
+        return _MAX_CURSOR_BATCH
+    avg = max(size // count, _MIN_AVG_DOC_BYTES)
+    return max(_MIN_CURSOR_BATCH,
+               min(_MAX_CURSOR_BATCH, _CURSOR_BATCH_TARGET_BYTES // avg))
 
 def get_collections_info(client) -> Dict[str, List[Tuple[str, int, int]]]:
     """Get information about all collections in the MongoDB instance.
-    Returns a dict of db_name -> list of (collection_name, doc_count, size)"""
+    Returns a dict of db_name -> list of (collection_name, doc_count, size)
+
+    Stats are fetched with $collStats aggregations issued concurrently, so
+    startup waits roughly one round-trip per database instead of one per
+    collection.
+    """
     collections_info = {}
-    
-    for db_name in client.list_database_names():
-        # Skip system databases
-        if db_name in ['admin', 'local', 'config']:
-            continue
-            
-        db = client[db_name]
-        collections_info[db_name] = []
-        
-        for coll_name in db.list_collection_names():
-            # Skip system collections silently
-            if coll_name.startswith('system.'):
-                continue
-                
-            try:
-                # Get collection stats
-                stats = db.command('collStats', coll_name)
-                doc_count = stats.get('count', 0)
-                size = stats.get('size', 0)
-                collections_info[db_name].append((coll_name, doc_count, size))
-            except Exception as e:
-                # Skip collections we can't access without logging warnings
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for db_name in client.list_database_names():
+            # Skip system databases
+            if db_name in ['admin', 'local', 'config']:
                 continue
-    
+
+            db = client[db_name]
+
+            # Skip system collections silently
+            coll_names = [
+                name for name in db.list_collection_names()
+                if not name.startswith('system.')
+            ]
+
+            # executor.map preserves collection order; inaccessible
+            # collections come back as None and are dropped
+            results = executor.map(lambda name, d=db: _collection_stats(d, name),
+                                   coll_names)
+            collections_info[db_name] = [r for r in results if r is not None]
+
     # Remove empty databases
     collections_info = {k: v for k, v in collections_info.items() if v}
     return collections_info
 
-def backup_collection(client, db_name: str, collection_name: str, backup_dir: Path, batch_size: int = 1000, 
-                     max_retries: int = 3, retry_delay: int = 5) -> bool:
-    """Backup a MongoDB collection to a JSON file.
-    
+def backup_collection(client, db_name: str, collection_name: str, backup_dir: Path, batch_size: int = None,
+                     max_retries: int = 3, retry_delay: int = 5, output_format: str = 'json',
+                     compress: bool = False, workers: int = 1) -> bool:
+    """Backup a MongoDB collection to a JSON or raw BSON file.
+
     Args:
         client: MongoDB client instance
         db_name: Database name
         collection_name: Collection name
         backup_dir: Directory to store backup
-        batch_size: Number of documents to process in each batch (default: 1000)
+        batch_size: Documents per cursor batch and per buffered write
+            (default: tuned from the collection's average document size to
+            target ~1 MB per getMore reply). Large batches amortize
+            round-trips; too-small ones are a known 10x+ throughput trap.
         max_retries: Maximum number of retry attempts for failed operations (default: 3)
         retry_delay: Delay in seconds between retry attempts (default: 5)
-        
+        output_format: 'json' for Extended JSON Lines (default; one document
+            per line in a .jsonl file) or 'bson' for a raw BSON stream. The
+            BSON path copies documents byte-for-byte without decoding them
+            into Python dicts, which is much faster and smaller.
+        compress: If True, stream the output through zstd (.zst suffix);
+            JSON backups typically shrink 5-10x. Requires the zstandard
+            package.
+        workers: Worker threads to spread the backup over (default: 1).
+            More than one delegates to backup_collection_parallel, which
+            shards the _id space; note the parallel path does not resume.
+
     Returns:
         bool: True if backup was successful, False otherwise
     """
+    if workers > 1:
+        return backup_collection_parallel(client, db_name, collection_name, backup_dir,
+                                          workers=workers, batch_size=batch_size,
+                                          output_format=output_format, compress=compress)
+    if compress and zstd is None:
+        logger.error("Compressed backup requested but zstandard is not installed")
+        return False
     retry_count = 0
     last_processed_id = None
     processed_total = 0
+    # Documents actually handed to the writer. processed_total can double-
+    # count across retries (a mid-batch failure re-fetches the buffered
+    # tail), so the sidecar count comes from this instead
+    written_total = 0
     
     while retry_count <= max_retries:
         try:
             db = client[db_name]
             
-            # Check if collection exists using list_collection_names (requires less privileges)
-            if collection_name not in db.list_collection_names():
+            # Check if collection exists using list_collection_names (requires
+            # less privileges); the name filter makes it a single lookup on
+            # the server rather than an enumeration of every collection
+            if not db.list_collection_names(filter={'name': collection_name}):
                 logger.error(f"Collection {collection_name} does not exist in database {db_name}")
                 return False
             
-            collection = db[collection_name]
-            
+            use_bson = output_format == 'bson'
+            if use_bson:
+                # RawBSONDocument hands back the server's bytes without
+                # materializing per-field Python objects
+                collection = db.get_collection(
+                    collection_name,
+                    codec_options=CodecOptions(document_class=RawBSONDocument))
+            else:
+                collection = db[collection_name]
+
+            if batch_size is None:
+                batch_size = _tuned_cursor_batch(collection)
+
             # Create backup directory
             try:
                 backup_path = backup_dir / db_name
@@ -132,73 +254,112 @@ def backup_collection(client, db_name: str, collection_name: str, backup_dir: Pa
                 logger.error(f"Failed to create backup directory: {str(e)}")
                 return False
 
-            # Get an estimate of total documents using collStats
+            # Get an estimate of total documents; estimated_document_count
+            # reads cached collection metadata instead of scanning
             try:
-                stats = db.command('collStats', collection_name)
-                estimated_docs = stats.get('count', 0)
+                estimated_docs = collection.estimated_document_count()
             except Exception as e:
                 logger.warning(f"Could not get collection stats, progress may be inaccurate: {e}")
                 estimated_docs = 0
             
             # Process and write documents in batches
-            backup_file = backup_path / f"{collection_name}.json"
-            
+            suffix = '.bson' if use_bson else '.jsonl'
+            if compress:
+                suffix += '.zst'
+            backup_file = backup_path / f"{collection_name}{suffix}"
+
             try:
-                # Open file in append mode if resuming, otherwise write mode
-                file_mode = 'a' if last_processed_id else 'w'
-                with open(backup_file, file_mode) as f:
-                    # Write opening bracket if starting fresh
-                    if not last_processed_id:
-                        f.write('[\n')
-                    
+                # Open file in append mode if resuming, otherwise write mode.
+                # A single buffered handle is kept open for the whole backup so
+                # each document write hits the buffer, not the filesystem.
+                # On resume the compressor appends a fresh zstd frame;
+                # decompression reads concatenated frames as one stream
+                file_mode = 'ab' if last_processed_id else 'wb'
+                # threads=-1 compresses with one worker per core, keeping the
+                # codec off this thread's critical path
+                # The single-threaded writer executor overlaps disk writes
+                # (and compression) with cursor fetch and encoding; one
+                # worker keeps batches in file order. It is entered after
+                # the file contexts, so on exit it drains queued writes
+                # before the file flushes and closes.
+                with open(backup_file, file_mode, buffering=WRITE_BUFFER_SIZE) as raw, \
+                        (zstd.ZstdCompressor(level=3, threads=-1).stream_writer(raw)
+                         if compress else nullcontext(raw)) as f, \
+                        ThreadPoolExecutor(max_workers=1) as writer:
+                    # No framing to write: JSON Lines and BSON streams are
+                    # both plain document concatenations, which is what makes
+                    # append-mode resume safe by construction
                     # Use tqdm with estimated total, will adjust if estimate was off
-                    with tqdm(total=estimated_docs, desc=f"Backing up {db_name}.{collection_name}", 
+                    with tqdm(total=estimated_docs, desc=f"Backing up {db_name}.{collection_name}",
                              unit="docs", dynamic_ncols=True, initial=processed_total) as pbar:
-                        
-                        # Build query to resume from last processed document if applicable
+
+                        # Build query to resume from last processed document if applicable.
+                        # The cursor walks the _id index in order (sort plus hint), which
+                        # is what makes the $gt resume sound -- an unsorted cursor gives
+                        # no order guarantee, so resuming could skip or duplicate
+                        # documents -- and keeps each retry a bounded index seek.
+                        # An explicit batch_size bounds per-getMore memory and keeps
+                        # throughput predictable; no_cursor_timeout stops the server
+                        # reaping the cursor during slow disk writes.
                         query = {'_id': {'$gt': last_processed_id}} if last_processed_id else {}
-                        cursor = collection.find(query, batch_size=batch_size)
-                        batch = []
-                        
+                        cursor = collection.find(query, batch_size=batch_size,
+                                                 sort=[('_id', 1)], hint='_id_',
+                                                 no_cursor_timeout=True)
+
+                        # Encoded documents accumulate in one reusable
+                        # bytearray that is written and cleared per batch,
+                        # so the hot loop allocates no per-document buffers
+                        # and the file sees one large write per batch
+                        buffer = bytearray()
+                        buffer_docs = 0
+                        buffer_last_id = last_processed_id
+                        in_flight = []
+
                         for doc in cursor:
-                            # Convert types inline
-                            processed_doc = process_document(doc)
-                            batch.append(processed_doc)
-                            last_processed_id = doc['_id']
-                            
+                            if use_bson:
+                                buffer += doc.raw
+                            else:
+                                buffer += encode_document(doc)
+                                buffer += b'\n'
+
+                            buffer_last_id = doc['_id']
+                            buffer_docs += 1
                             processed_total += 1
-                            
-                            # Write batch when it reaches batch_size
-                            if len(batch) >= batch_size:
-                                # Write batch with comma if not first batch
-                                batch_json = json.dumps(batch, indent=2)[1:-1]  # Remove [ and ]
-                                if processed_total > batch_size:
-                                    f.write(',\n')
-                                f.write(batch_json)
-                                
-                                # Clear batch
-                                batch = []
-                                
-                                # Flush to disk periodically
-                                f.flush()
-                            
+
+                            # Hand the batch to the background writer. A
+                            # handed-off batch is safe to count as processed
+                            # for resume: even when an error unwinds the
+                            # with block, the writer drains its queue before
+                            # the file flushes and closes. In-flight batches
+                            # are bounded to cap memory; reaped results
+                            # surface any write error
+                            if processed_total % batch_size == 0:
+                                in_flight.append(writer.submit(f.write, bytes(buffer)))
+                                buffer.clear()
+                                if len(in_flight) > 4:
+                                    in_flight.pop(0).result()
+                                last_processed_id = buffer_last_id
+                                written_total += buffer_docs
+                                buffer_docs = 0
+
                             pbar.update(1)
-                            
+
                             # If our estimate was low, update total
                             if processed_total > estimated_docs:
                                 pbar.total = processed_total + batch_size
-                        
-                        # Write any remaining documents
-                        if batch:
-                            if processed_total > batch_size:
-                                f.write(',\n')
-                            batch_json = json.dumps(batch, indent=2)[1:-1]
-                            f.write(batch_json)
-                        
-                        # Write closing bracket
-                        f.write('\n]')
-                    
-                logger.info(f"Successfully backed up {processed_total} documents to {backup_file}")
+
+                        # Write any buffered tail documents and surface
+                        # errors from outstanding writes
+                        if buffer:
+                            in_flight.append(writer.submit(f.write, bytes(buffer)))
+                        for future in in_flight:
+                            future.result()
+                        last_processed_id = buffer_last_id
+                        written_total += buffer_docs
+
+
+                _write_meta(backup_path, collection_name, written_total, backup_file)
+                logger.info(f"Successfully backed up {written_total} documents to {backup_file}")
                 return True
                 
             except (ConnectionFailure, OperationFailure) as e:
@@ -224,5 +385,258 @@ def backup_collection(client, db_name: str, collection_name: str, backup_dir: Pa
         except Exception as e:
             logger.error(f"Unexpected error during backup: {str(e)}")
             return False
-            
+
     return False
+
+def _backup_one(mongodb_url: str, db_name: str, collection_name: str, backup_dir: Path,
+                output_format: str, compress: bool) -> Tuple[str, str, bool]:
+    """Process-pool worker: back up one collection with its own client.
+
+    Module-level so it pickles under both fork and spawn start methods.
+    MongoClient connection pools aren't safe across forks, so each worker
+    opens its own connection.
+    """
+    client = MongoClient(mongodb_url)
+    try:
+        ok = backup_collection(client, db_name, collection_name, backup_dir,
+                               output_format=output_format, compress=compress)
+    finally:
+        client.close()
+    return db_name, collection_name, ok
+
+def backup_all_collections(mongodb_url: str, collections_info: Dict[str, List[Tuple[str, int, int]]],
+                           backup_dir: Path, workers: int = None,
+                           output_format: str = 'json', compress: bool = False) -> bool:
+    """Backup every collection in collections_info, one per worker process.
+
+    Collections are independent cursors, so spreading them over processes
+    scales near-linearly and sidesteps the GIL during JSON encoding.
+    collections_info has the shape get_collections_info returns.
+
+    Args:
+        mongodb_url: MongoDB connection string (each worker opens its own client)
+        collections_info: Dict of db_name -> list of (collection_name, doc_count, size)
+        backup_dir: Directory to store backups
+        workers: Number of worker processes (default: CPU count, capped at
+            the number of collections)
+        output_format: 'json' or 'bson', as for backup_collection
+        compress: If True, compress backup files with zstd
+
+    Returns:
+        bool: True if every collection backed up successfully, False otherwise
+    """
+    targets = [
+        (db_name, coll_name)
+        for db_name, collections in collections_info.items()
+        for coll_name, _, _ in collections
+    ]
+    if not targets:
+        logger.warning("No collections to backup")
+        return False
+
+    workers = min(workers or os.cpu_count() or 1, len(targets))
+    all_ok = True
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_backup_one, mongodb_url, db_name, coll_name,
+                            backup_dir, output_format, compress)
+            for db_name, coll_name in targets
+        ]
+        for future in futures:
+            db_name, coll_name, ok = future.result()
+            if not ok:
+                logger.error(f"Backup failed for {db_name}.{coll_name}")
+                all_ok = False
+    return all_ok
+
+def backup_collection_mongodump(mongodb_url: str, db_name: str, collection_name: str,
+                                backup_dir: Path) -> bool:
+    """Backup a collection by shelling out to mongodump.
+
+    mongodump keeps the dump server-optimized end to end: documents stream
+    as raw BSON with no Python decode or JSON encode at all. The output
+    lands at backup_dir/db_name/collection_name.bson, which restore reads
+    natively (mongodump's .metadata.json sidecar is ignored by listings).
+
+    Opt-in fast path: requires the mongodump binary on PATH; callers fall
+    back to backup_collection when it is unavailable.
+
+    Returns:
+        bool: True if backup was successful, False otherwise
+    """
+    if shutil.which('mongodump') is None:
+        logger.error("mongodump not found on PATH")
+        return False
+
+    try:
+        backup_dir.mkdir(parents=True, exist_ok=True)
+        result = subprocess.run(
+            ['mongodump', '--uri', mongodb_url, '--db', db_name,
+             '--collection', collection_name, '--out', str(backup_dir)],
+            capture_output=True, text=True)
+        if result.returncode != 0:
+            logger.error(f"mongodump failed: {result.stderr.strip()}")
+            return False
+        logger.info(f"Successfully backed up {db_name}.{collection_name} via mongodump")
+        return True
+    except Exception as e:
+        logger.error(f"Unexpected error running mongodump: {str(e)}")
+        return False
+
+def _backup_id_range(collection, query, part_file: Path, batch_size: int, use_bson: bool,
+                     compress: bool, pbar) -> int:
+    """Backup one _id range of a collection to a part file.
+
+    Returns the number of documents written. Compressed parts are complete
+    zstd frames, so the stitched file decompresses as one stream.
+    """
+    count = 0
+    # Single-threaded compressor here: the workers themselves are the
+    # parallelism, and per-worker compression threads would oversubscribe
+    with open(part_file, 'wb', buffering=WRITE_BUFFER_SIZE) as raw, \
+            (zstd.ZstdCompressor(level=3).stream_writer(raw)
+             if compress else nullcontext(raw)) as f:
+        cursor = collection.find(query, batch_size=batch_size, no_cursor_timeout=True)
+        for doc in cursor:
+            if use_bson:
+                f.write(doc.raw)
+            else:
+                f.write(encode_document(doc))
+                f.write(b'\n')
+            count += 1
+            pbar.update(1)
+    return count
+
+def backup_collection_parallel(client, db_name: str, collection_name: str, backup_dir: Path,
+                               workers: int = None, batch_size: int = None,
+                               output_format: str = 'json', compress: bool = False) -> bool:
+    """Backup a collection with multiple worker threads over _id ranges.
+
+    The _id space is split into roughly equal buckets with $bucketAuto and
+    each worker streams its range through its own cursor into a part file;
+    the parts are stitched together in order afterwards. Cursor reads and
+    the C-level JSON encoding release the GIL, so workers overlap network
+    receive and serialization.
+
+    Args:
+        client: MongoDB client instance
+        db_name: Database name
+        collection_name: Collection name
+        backup_dir: Directory to store backup
+        workers: Number of worker threads (default: CPU count)
+        batch_size: Cursor batch size per worker (default: tuned from the
+            collection's average document size, as for backup_collection)
+        output_format: 'json' or 'bson', as for backup_collection
+        compress: If True, each worker compresses its part with zstd; the
+            stitched frames decompress as one stream
+
+    Returns:
+        bool: True if backup was successful, False otherwise
+    """
+    workers = workers or os.cpu_count() or 1
+    if compress and zstd is None:
+        logger.error("Compressed backup requested but zstandard is not installed")
+        return False
+
+    try:
+        db = client[db_name]
+
+        if not db.list_collection_names(filter={'name': collection_name}):
+            logger.error(f"Collection {collection_name} does not exist in database {db_name}")
+            return False
+
+        use_bson = output_format == 'bson'
+        if use_bson:
+            collection = db.get_collection(
+                collection_name,
+                codec_options=CodecOptions(document_class=RawBSONDocument))
+        else:
+            collection = db[collection_name]
+
+        if batch_size is None:
+            batch_size = _tuned_cursor_batch(collection)
+
+        # Split the _id space into contiguous ranges
+        buckets = list(collection.aggregate([
+            {"$bucketAuto": {"groupBy": "$_id", "buckets": workers}}
+        ]))
+        if workers < 2 or len(buckets) < 2:
+            # Not enough data (or workers) to be worth splitting
+            return backup_collection(client, db_name, collection_name, backup_dir,
+                                     batch_size=batch_size, output_format=output_format,
+                                     compress=compress)
+
+        queries = []
+        for i, bucket in enumerate(buckets):
+            lo = bucket['_id']['min']
+            if i < len(buckets) - 1:
+                queries.append({'_id': {'$gte': lo, '$lt': buckets[i + 1]['_id']['min']}})
+            else:
+                queries.append({'_id': {'$gte': lo, '$lte': bucket['_id']['max']}})
+
+        backup_path = backup_dir / db_name
+        backup_path.mkdir(parents=True, exist_ok=True)
+        suffix = '.bson' if use_bson else '.jsonl'
+        if compress:
+            suffix += '.zst'
+        backup_file = backup_path / f"{collection_name}{suffix}"
+        part_files = [backup_path / f"{collection_name}{suffix}.part{i}"
+                      for i in range(len(queries))]
+
+        try:
+            estimated_docs = collection.estimated_document_count()
+        except Exception:
+            estimated_docs = 0
+
+        try:
+            with tqdm(total=estimated_docs, desc=f"Backing up {db_name}.{collection_name}",
+                     unit="docs", dynamic_ncols=True) as pbar:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(_backup_id_range, collection, query,
+                                        part_file, batch_size, use_bson, compress, pbar)
+                        for query, part_file in zip(queries, part_files)
+                    ]
+                    counts = [future.result() for future in futures]
+
+            # Range queries are type-bracketed -- they only match values of
+            # the same BSON type as their bounds -- while $bucketAuto
+            # boundaries follow the full cross-type sort order, so documents
+            # with mixed-type _ids can fall outside every worker's range.
+            # A backup must never silently lose documents: recount exactly
+            # (cheap next to the backup itself) and fall back to the
+            # sequential full scan on any mismatch
+            expected = collection.count_documents({})
+            if sum(counts) != expected:
+                logger.warning(
+                    f"Parallel backup captured {sum(counts)} of {expected} documents "
+                    f"(mixed-type _id values?); falling back to sequential backup")
+                return backup_collection(client, db_name, collection_name, backup_dir,
+                                         batch_size=batch_size, output_format=output_format,
+                                         compress=compress)
+
+            # Stitch the parts together in _id order; both formats are plain
+            # document concatenations, so this is a straight byte copy
+            with open(backup_file, 'wb', buffering=WRITE_BUFFER_SIZE) as out:
+                for part_file in part_files:
+                    with open(part_file, 'rb') as pf:
+                        shutil.copyfileobj(pf, out, WRITE_BUFFER_SIZE)
+
+            _write_meta(backup_path, collection_name, sum(counts), backup_file)
+            logger.info(f"Successfully backed up {sum(counts)} documents to {backup_file}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed during parallel backup: {str(e)}")
+            if backup_file.exists():
+                backup_file.unlink()
+            return False
+
+        finally:
+            for part_file in part_files:
+                if part_file.exists():
+                    part_file.unlink()
+
+    except Exception as e:
+        logger.error(f"Unexpected error during parallel backup: {str(e)}")
+        return False
@@ -1,46 +1,239 @@
 """Core functionality for MongoDB restore operations."""
 
+import io
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Tuple
-from bson import ObjectId
+import ijson
+from bson import ObjectId, decode_file_iter, encode, json_util
 from datetime import datetime
+from pymongo import IndexModel, MongoClient, WriteConcern
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
 logger = logging.getLogger(__name__)
 
+# Recognized backup file layouts: (suffix, format, compressed). Order also
+# sets the preference when a collection exists in several formats: raw BSON
+# first, since it decodes in C with native types and no restoration pass;
+# then 'jsonl' (the current JSON Lines layout) and the legacy single-array
+# 'json'; compressed variants last.
+_BACKUP_CANDIDATES = (
+    ('.bson', 'bson', False),
+    ('.jsonl', 'jsonl', False),
+    ('.json', 'json', False),
+    ('.bson.zst', 'bson', True),
+    ('.jsonl.zst', 'jsonl', True),
+    ('.json.zst', 'json', True),
+)
+
+# Matches the options used on the backup side; json_util accepts both
+# canonical and relaxed Extended JSON on the way back in.
+JSON_OPTIONS = json_util.RELAXED_JSON_OPTIONS
+
+# Key shape of the legacy {"$type": ..., "$value": ...} tagging; comparing
+# the whole keys view against this set is one check instead of two lookups,
+# and the len guard rejects almost every dict before that.
+_LEGACY_SENTINEL = frozenset(("$type", "$value"))
+
 class RestoreError(Exception):
     """Custom exception for restore operations."""
     pass
 
+def _open_backup_stream(raw, compressed: bool):
+    """Wrap the raw backup file in a zstd reader when compressed.
+
+    The decompressor is wrapped in a BufferedReader so the result supports
+    line iteration like a plain file handle. read_across_frames is set
+    explicitly because stitched parallel backups and resumed backups are
+    several concatenated frames, and backend defaults have differed across
+    zstandard releases.
+    """
+    if not compressed:
+        return raw
+    if zstd is None:
+        raise RestoreError("Compressed backup found but zstandard is not installed")
+    return io.BufferedReader(
+        zstd.ZstdDecompressor().stream_reader(raw, read_across_frames=True))
+
+def _find_backup_file(db_dir: Path, collection_name: str):
+    """Locate the backup file for a collection.
+
+    Returns (path, format, compressed) or None if no candidate exists.
+    """
+    for suffix, file_format, compressed in _BACKUP_CANDIDATES:
+        candidate = db_dir / f"{collection_name}{suffix}"
+        if candidate.exists():
+            return candidate, file_format, compressed
+    return None
+
+def _sidecar_count(db_dir: Path, collection_name: str):
+    """Read the document count from a backup's .meta.json sidecar.
+
+    Returns None when the sidecar is missing or unreadable, in which case
+    the caller falls back to counting the backup file itself.
+    """
+    try:
+        with open(db_dir / f"{collection_name}.meta.json") as f:
+            return json.load(f)['count']
+    except (OSError, ValueError, KeyError):
+        return None
+
+def _count_documents(collection_file: Path, file_format: str, compressed: bool) -> int:
+    """Count the documents in a backup file without materializing them."""
+    with open(collection_file, 'rb') as raw:
+        f = _open_backup_stream(raw, compressed)
+        if file_format == 'bson':
+            return sum(1 for _ in decode_file_iter(f))
+        if file_format == 'jsonl':
+            return sum(1 for line in f if line.strip())
+        return sum(1 for _ in ijson.items(f, 'item'))
+
+def _iter_documents(f, file_format: str):
+    """Yield documents from a JSON-family backup stream, types restored.
+
+    JSON Lines files parse one line at a time; legacy single-array files
+    stream through ijson, so peak memory stays at one document either way
+    (use_float keeps numbers as floats rather than Decimals, which BSON
+    cannot encode).
+
+    Type restoration is fused into parsing where the parser allows it:
+    without orjson, json_util.loads converts Extended JSON wrappers via
+    its object_hook while objects are built, one pass instead of two.
+    orjson has no object_hook, so its (much faster) parse keeps a separate
+    restore_types walk. JSON Lines files never carry the legacy
+    $type/$value tags -- that format predates them -- so the hook path
+    loses nothing.
+    """
+    if file_format == 'jsonl':
+        if orjson is None:
+            for line in f:
+                if line.strip():
+                    yield json_util.loads(line, json_options=JSON_OPTIONS)
+        else:
+            for line in f:
+                if not line.strip():
+                    continue
+                doc = orjson.loads(line)
+                # Byte-level screen before the semantic walk: every
+                # Extended JSON wrapper and legacy tag starts a key with
+                # '$', so a line without the '"$' byte pair has nothing
+                # to restore. False positives (a '"$' inside a string
+                # value) only cost a wasted walk, never correctness.
+                if b'"$' in line:
+                    doc = restore_types(doc)
+                yield doc
+    else:
+        for doc in ijson.items(f, 'item', use_float=True):
+            yield restore_types(doc)
+
+# Folder-level summary written after a backup run; listings read this one
+# file instead of re-scanning every collection file.
+MANIFEST_NAME = 'manifest.json'
+
+def _read_manifest(backup_folder: Path):
+    """Load collections info from the folder manifest, or None if absent.
+
+    Returns the same db_name -> [(collection_name, doc_count, size)]
+    mapping as a full scan.
+    """
+    try:
+        with open(backup_folder / MANIFEST_NAME) as f:
+            raw = json.load(f)
+        return {db_name: [tuple(entry) for entry in entries]
+                for db_name, entries in raw.items()}
+    except OSError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable manifest in {backup_folder}: {str(e)}")
+        return None
+
+def write_manifest(backup_folder: Path) -> None:
+    """Write the folder manifest summarizing a finished backup run.
+
+    Best effort: listings fall back to scanning when the manifest is
+    missing, so a failed write only costs speed.
+    """
+    try:
+        info = _scan_collections_info(backup_folder)
+        with open(backup_folder / MANIFEST_NAME, 'w') as f:
+            json.dump(info, f)
+    except Exception as e:
+        logger.warning(f"Could not write manifest for {backup_folder}: {str(e)}")
+
 def get_collections_info(backup_folder: Path) -> Dict[str, List[Tuple[str, int, int]]]:
     """Get information about all collections in the backup.
-    Returns a dict of db_name -> list of (collection_name, doc_count, size)"""
+    Returns a dict of db_name -> list of (collection_name, doc_count, size)
+
+    Reads the manifest written at backup time when present; otherwise
+    scans the folder (sidecar counts first, streaming counts as a last
+    resort).
+    """
+    manifest = _read_manifest(backup_folder)
+    if manifest is not None:
+        return manifest
+    return _scan_collections_info(backup_folder)
+
+def _scan_collections_info(backup_folder: Path) -> Dict[str, List[Tuple[str, int, int]]]:
+    """Scan a backup folder for collections info, file by file."""
     collections_info = {}
-    
+
     try:
         for db_dir in backup_folder.iterdir():
             if not db_dir.is_dir():
                 continue
                 
             collections_info[db_dir.name] = []
-            
-            for collection_file in db_dir.glob("*.json"):
+
+            # A collection backed up in several formats must yield one
+            # entry, or restore_all would restore it once per file. Keep
+            # the best candidate per name, ranked by the same preference
+            # order _find_backup_file applies
+            candidates = {}
+            for collection_file in sorted(db_dir.iterdir()):
+                # Sidecars (ours and mongodump's) would otherwise match the
+                # legacy .json suffix
+                if collection_file.name.endswith(('.meta.json', '.metadata.json')):
+                    continue
+                for rank, (suffix, file_format, compressed) in enumerate(_BACKUP_CANDIDATES):
+                    if collection_file.name.endswith(suffix):
+                        collection_name = collection_file.name[:-len(suffix)]
+                        best = candidates.get(collection_name)
+                        if best is None or rank < best[0]:
+                            candidates[collection_name] = (
+                                rank, collection_file, file_format, compressed)
+                        break
+
+            for collection_name, (_, collection_file, file_format, compressed) \
+                    in sorted(candidates.items()):
                 try:
-                    # Count documents and get file size
-                    with open(collection_file) as f:
-                        data = json.load(f)
-                        doc_count = len(data)
-                        size = collection_file.stat().st_size
-                        
+                    # Prefer the sidecar count; stream-count the file itself
+                    # only for backups written without one
+                    doc_count = _sidecar_count(db_dir, collection_name)
+                    if doc_count is None:
+                        doc_count = _count_documents(collection_file, file_format, compressed)
+                    size = collection_file.stat().st_size
+
                     collections_info[db_dir.name].append(
-                        (collection_file.stem, doc_count, size)
+                        (collection_name, doc_count, size)
                     )
                 except Exception as e:
                     logger.error(f"Error reading collection file {collection_file}: {str(e)}")
                     continue
-        
+
         # Remove empty databases
         collections_info = {k: v for k, v in collections_info.items() if v}
         return collections_info
@@ -50,79 +243,240 @@ def get_collections_info(backup_folder: Path) -> Dict[str, List[Tuple[str, int,
         return {}
 
 def restore_types(value):
-    """Convert string format back to MongoDB types."""
-    if isinstance(value, dict):
-        if "$type" in value and "$value" in value:
-            type_name = value["$type"]
-            type_value = value["$value"]
-            if type_name == "ObjectId":
-                return ObjectId(type_value)
-            elif type_name == "datetime":
-                return datetime.fromisoformat(type_value)
-        return {k: restore_types(v) for k, v in value.items()}
-    elif isinstance(value, list):
-        return [restore_types(v) for v in value]
-    return value
-
-def restore_collection(client, backup_dir: Path, db_name: str, collection_name: str, force: bool = False) -> bool:
+    """Convert backup JSON back to MongoDB types.
+
+    Understands relaxed/canonical Extended JSON ({"$oid": ...},
+    {"$date": ...}) via bson.json_util, plus the legacy
+    {"$type": ..., "$value": ...} tagging written by older versions.
+
+    The tree is walked with an explicit stack instead of recursion, so
+    deeply nested documents cost no Python call frames. Dicts are visited
+    twice -- children first, then the json_util hook on the converted dict
+    -- because Extended JSON wrappers can nest (e.g. $oid inside $ref).
+    Containers are mutated in place; they are throwaway parser output.
+    """
+    # A one-slot root makes the parent-slot fixup uniform for every node
+    root = [value]
+    stack = [(root, 0, value, False)]
+    append = stack.append
+    pop = stack.pop
+    object_hook = json_util.object_hook
+    json_options = JSON_OPTIONS
+    object_id = ObjectId
+    from_isoformat = datetime.fromisoformat
+    legacy_sentinel = _LEGACY_SENTINEL
+
+    while stack:
+        parent, key, node, visited = pop()
+        if node.__class__ is dict or isinstance(node, dict):
+            if visited:
+                parent[key] = object_hook(node, json_options=json_options)
+                continue
+            if len(node) == 2 and node.keys() == legacy_sentinel:
+                # Legacy tagging predates the Extended JSON format
+                type_name = node["$type"]
+                if type_name == "ObjectId":
+                    parent[key] = object_id(node["$value"])
+                    continue
+                elif type_name == "datetime":
+                    parent[key] = from_isoformat(node["$value"])
+                    continue
+            append((parent, key, node, True))
+            for k, v in node.items():
+                append((node, k, v, False))
+        elif node.__class__ is list or isinstance(node, list):
+            for i, v in enumerate(node):
+                append((node, i, v, False))
+        # Scalars are already in place in their parent
+
+    return root[0]
+
+def _capture_secondary_indexes(collection) -> List[IndexModel]:
+    """Snapshot a collection's secondary indexes as IndexModel specs.
+
+    Data loads much faster into an unindexed collection, so restore drops
+    the collection (losing its indexes), bulk-inserts, and rebuilds these
+    at the end in a single createIndexes command.
+    """
+    models = []
+    for spec in collection.list_indexes():
+        if spec['name'] == '_id_':
+            continue
+        options = {k: v for k, v in spec.items() if k not in ('key', 'v', 'ns')}
+        models.append(IndexModel(list(spec['key'].items()), **options))
+    return models
+
+# Writer threads for insert batches. pymongo releases the GIL during socket
+# I/O, so a few writers overlap parsing with server-side application; beyond
+# this, server-side lock contention dominates.
+_INSERT_WORKERS = 4
+
+# Batch autotuning: size batches to ~10 MB of BSON per insert_many -- small
+# documents get big batches, huge documents stay clear of the 16 MB message
+# limit. Bounds keep degenerate estimates sane.
+_BATCH_TARGET_BYTES = 10 << 20
+_BATCH_SAMPLE_DOCS = 10
+_MIN_BATCH_DOCS = 50
+_MAX_BATCH_DOCS = 10000
+
+def _tuned_batch_size(sample_docs) -> int:
+    """Pick a batch size from the average BSON size of the sampled docs."""
+    sizes = [len(encode(doc)) for doc in sample_docs]
+    avg = max(1, sum(sizes) // len(sizes))
+    return max(_MIN_BATCH_DOCS, min(_MAX_BATCH_DOCS, _BATCH_TARGET_BYTES // avg))
+
+def _insert_documents(target, documents, pbar, batch_size: int = None) -> int:
+    """Insert an iterable of documents through a pool of writer threads.
+
+    Batches are dispatched to the pool so the next batch is parsed while
+    earlier ones are in flight, with in-flight batches bounded to cap
+    memory. ordered=False lets the server apply each batch in parallel and
+    aggregate any errors instead of aborting at the first one; failures
+    surface through the collected future results.
+
+    batch_size defaults to autotuning from the first few documents'
+    encoded size; pass an explicit value to override.
+
+    Returns the number of documents inserted.
+    """
+    with ThreadPoolExecutor(max_workers=_INSERT_WORKERS) as executor:
+        in_flight = []
+
+        def _reap(pending_limit: int):
+            while len(in_flight) > pending_limit:
+                future, count = in_flight.pop(0)
+                future.result()
+                pbar.update(count)
+
+        def _submit(batch):
+            in_flight.append((
+                executor.submit(target.insert_many, batch, ordered=False),
+                len(batch)))
+            _reap(2 * _INSERT_WORKERS)
+
+        documents = iter(documents)
+        if batch_size is None:
+            sample = list(islice(documents, _BATCH_SAMPLE_DOCS))
+            if not sample:
+                return 0
+            batch_size = _tuned_batch_size(sample)
+        else:
+            sample = []
+
+        # One buffer filled by index and reused across batches: no list
+        # growth in the hot loop and no fresh allocation per batch. The
+        # slice at submit hands the pool a stable copy, which is needed
+        # anyway since the buffer refills while the insert is in flight.
+        buf = [None] * batch_size
+        idx = len(sample)
+        buf[:idx] = sample
+        total_docs = idx
+
+        for doc in documents:
+            buf[idx] = doc
+            idx += 1
+            total_docs += 1
+            if idx == batch_size:
+                _submit(buf[:idx])
+                idx = 0
+
+        if idx:
+            _submit(buf[:idx])
+        _reap(0)
+
+    return total_docs
+
+def _get_target_collection(db, collection_name: str, acknowledged: bool):
+    """Get the collection to insert into, honoring the write concern choice."""
+    if acknowledged:
+        return db[collection_name]
+    return db.get_collection(collection_name, write_concern=WriteConcern(w=0))
+
+def _restore_bson_file(db, collection_name: str, bson_file: Path, acknowledged: bool = True,
+                       compressed: bool = False, index_models: List[IndexModel] = None) -> bool:
+    """Restore a collection from a raw BSON stream backup.
+
+    Documents are decoded straight from the byte stream, so no Extended JSON
+    parsing or type restoration is needed.
+    """
+    try:
+        target = _get_target_collection(db, collection_name, acknowledged)
+        with open(bson_file, 'rb') as raw:
+            f = _open_backup_stream(raw, compressed)
+            with tqdm(desc=f"Restoring {db.name}.{collection_name}",
+                     unit="docs", dynamic_ncols=True) as pbar:
+                total_docs = _insert_documents(target, decode_file_iter(f), pbar)
+
+        # Rebuild secondary indexes once the data is in place
+        if index_models:
+            db[collection_name].create_indexes(index_models)
+
+        logger.info(f"Successfully restored {total_docs} documents")
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed during restore: {str(e)}")
+        return False
+
+def restore_collection(client, backup_dir: Path, db_name: str, collection_name: str, force: bool = False,
+                       acknowledged: bool = True) -> bool:
     """Restore a MongoDB collection from a backup file.
-    
+
     Args:
         client: MongoDB client instance
         backup_dir: Directory containing backup
         db_name: Database name
         collection_name: Collection name
         force: If True, overwrite existing collection
-        
+        acknowledged: If False, insert with write concern w=0 (no per-batch
+            acknowledgement round-trip; faster, but errors go unreported)
+
     Returns:
         bool: True if restore was successful, False otherwise
-        
+
     Raises:
         RestoreError: If collection exists and force is False
     """
     try:
         db = client[db_name]
-        
-        # Check if collection exists
-        if collection_name in db.list_collection_names():
+
+        # Check if collection exists (name filter: single server-side lookup)
+        index_models = []
+        if db.list_collection_names(filter={'name': collection_name}):
             if not force:
                 raise RestoreError(f"Collection {collection_name} already exists in database {db_name}")
+            index_models = _capture_secondary_indexes(db[collection_name])
             db[collection_name].drop()
         
-        backup_file = backup_dir / db_name / f"{collection_name}.json"
-        if not backup_file.exists():
+        found = _find_backup_file(backup_dir / db_name, collection_name)
+        if found is None:
             return False
+        backup_file, file_format, compressed = found
 
-        # Read and process documents
+        if file_format == 'bson':
+            return _restore_bson_file(db, collection_name, backup_file,
+                                      acknowledged=acknowledged,
+                                      compressed=compressed,
+                                      index_models=index_models)
+
+        # Read and process documents one at a time, so peak memory stays at
+        # the bounded set of in-flight insert batches regardless of file
+        # size.
         try:
-            with open(backup_file, 'r') as f:
-                documents = json.load(f)
+            target = _get_target_collection(db, collection_name, acknowledged)
+
+            with open(backup_file, 'rb') as raw:
+                f = _open_backup_stream(raw, compressed)
+                documents = _iter_documents(f, file_format)
+
+                with tqdm(desc=f"Restoring {db_name}.{collection_name}",
+                         unit="docs", dynamic_ncols=True) as pbar:
+                    total_docs = _insert_documents(target, documents, pbar)
+
+            # Rebuild secondary indexes once the data is in place
+            if index_models:
+                db[collection_name].create_indexes(index_models)
 
-            # Convert types and restore in batches
-            batch_size = 1000
-            total_docs = len(documents)
-            
-            with tqdm(total=total_docs, desc=f"Restoring {db_name}.{collection_name}", 
-                     unit="docs", dynamic_ncols=True) as pbar:
-                
-                current_batch = []
-                
-                for doc in documents:
-                    # Convert types
-                    restored_doc = restore_types(doc)
-                    current_batch.append(restored_doc)
-                    
-                    # Insert batch if it reaches batch_size
-                    if len(current_batch) >= batch_size:
-                        db[collection_name].insert_many(current_batch)
-                        pbar.update(len(current_batch))
-                        current_batch = []
-                
-                # Insert any remaining documents
-                if current_batch:
-                    db[collection_name].insert_many(current_batch)
-                    pbar.update(len(current_batch))
-            
             logger.info(f"Successfully restored {total_docs} documents")
             return True
             
@@ -135,3 +489,69 @@ def restore_collection(client, backup_dir: Path, db_name: str, collection_name:
     except Exception as e:
         print(f"Error restoring collection: {e}")
         return False
+
+def _restore_one(mongodb_url: str, backup_dir: str, db_name: str, collection_name: str,
+                 force: bool, acknowledged: bool = True) -> Tuple[str, str, bool]:
+    """Process-pool worker: restore one collection with its own client.
+
+    Module-level so it pickles, and each worker builds its own MongoClient
+    because clients do not survive a fork.
+    """
+    client = MongoClient(mongodb_url)
+    try:
+        ok = restore_collection(client, Path(backup_dir), db_name, collection_name,
+                                force=force, acknowledged=acknowledged)
+    except RestoreError as e:
+        logger.error(str(e))
+        ok = False
+    except Exception as e:
+        logger.error(f"Failed to restore {db_name}.{collection_name}: {str(e)}")
+        ok = False
+    finally:
+        client.close()
+    return db_name, collection_name, ok
+
+def restore_all(mongodb_url: str, backup_dir: Path, force: bool = False,
+                workers: int = None, acknowledged: bool = True) -> bool:
+    """Restore every collection in a backup folder with a process pool.
+
+    Parsing and type restoration hold the GIL, so collections restore in
+    separate processes for near-linear scaling across cores; collections
+    are independent, which makes the split safe.
+
+    Args:
+        mongodb_url: Connection string; each worker opens its own client
+        backup_dir: Backup folder (one subdirectory per database)
+        force: If True, overwrite existing collections
+        workers: Worker processes (default: CPU count, capped at the
+            number of collections)
+        acknowledged: If False, insert with write concern w=0, as for
+            restore_collection
+
+    Returns:
+        bool: True if every collection restored successfully
+    """
+    collections_info = get_collections_info(backup_dir)
+    targets = [
+        (db_name, collection_name)
+        for db_name, collections in collections_info.items()
+        for collection_name, _, _ in collections
+    ]
+    if not targets:
+        logger.error(f"No collections found in {backup_dir}")
+        return False
+
+    workers = min(workers or os.cpu_count() or 1, len(targets))
+    all_ok = True
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_restore_one, mongodb_url, str(backup_dir),
+                            db_name, collection_name, force, acknowledged)
+            for db_name, collection_name in targets
+        ]
+        for future in futures:
+            db_name, collection_name, ok = future.result()
+            if not ok:
+                logger.error(f"Restore failed for {db_name}.{collection_name}")
+                all_ok = False
+    return all_ok
@@ -0,0 +1,80 @@
+"""SQLite index of backup folder summaries.
+
+With thousands of backups, even one manifest read per folder adds up
+when the wizard builds its selection menu. The index keeps every
+folder's summary in a single ``index.sqlite`` next to the backup
+folders, so listing costs one query. It is strictly a cache: writes are
+best effort, readers fall back to manifests and filesystem walks for
+folders it doesn't know, and the filesystem remains authoritative.
+"""
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = 'index.sqlite'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backups (
+    name TEXT PRIMARY KEY,
+    created_at TEXT,
+    db_count INTEGER,
+    collection_count INTEGER,
+    total_bytes INTEGER
+)
+"""
+
+def _connect(backups_dir: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the index next to the backup folders."""
+    conn = sqlite3.connect(backups_dir / INDEX_NAME)
+    conn.execute(_SCHEMA)
+    return conn
+
+def record_backup(backup_folder: Path, summary: Tuple[int, int, int]) -> None:
+    """Upsert one finished backup folder's summary into the index.
+
+    Best effort: a failed index write only costs listing speed, never
+    the backup.
+    """
+    db_count, collection_count, total_bytes = summary
+    backup_folder = Path(backup_folder)
+    created_at = backup_folder.name.replace('mongodb_backup_', '')
+    try:
+        conn = _connect(backup_folder.parent)
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO backups (name, created_at, db_count, collection_count, total_bytes) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET created_at=excluded.created_at, "
+                    "db_count=excluded.db_count, collection_count=excluded.collection_count, "
+                    "total_bytes=excluded.total_bytes",
+                    (backup_folder.name, created_at, db_count, collection_count, total_bytes))
+        finally:
+            conn.close()
+    except Exception as e:
+        logger.warning(f"Could not update backup index for {backup_folder}: {str(e)}")
+
+def load_summaries(backups_dir: Path) -> Dict[str, Tuple[int, int, int]]:
+    """Load all indexed summaries for a backups directory in one query.
+
+    Returns {folder_name: (db_count, collection_count, total_bytes)};
+    empty when there is no index or it can't be read.
+    """
+    backups_dir = Path(backups_dir)
+    if not (backups_dir / INDEX_NAME).exists():
+        return {}
+    try:
+        conn = sqlite3.connect(backups_dir / INDEX_NAME)
+        try:
+            rows = conn.execute(
+                "SELECT name, db_count, collection_count, total_bytes FROM backups")
+            return {name: (dbs, colls, size) for name, dbs, colls, size in rows}
+        finally:
+            conn.close()
+    except Exception as e:
+        logger.warning(f"Could not read backup index in {backups_dir}: {str(e)}")
+        return {}
@@ -1,18 +1,31 @@
-"""Interactive command-line wizard for MongoDB backup and restore operations."""
+"""Interactive command-line wizard for MongoDB backup and restore operations.
 
+questionary, rich and humanize pull in heavy import chains
+(prompt_toolkit, pygments), so they are imported lazily inside the
+functions that use them; plain CLI invocations never pay for them.
+"""
+
+import json
 import os
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-import questionary
-from rich.console import Console
-import humanize
 from typing import Dict, List, Tuple
 
+from . import _backup_index
 from ..core.backup import backup_collection, get_collections_info as get_source_collections_info
-from ..core.restore import restore_collection, get_collections_info as get_backup_collections_info
+from ..core.restore import MANIFEST_NAME, restore_collection, write_manifest, get_collections_info as get_backup_collections_info
+
+# File extensions that hold backed-up collections
+BACKUP_FILE_SUFFIXES = ('.jsonl', '.bson', '.json',
+                        '.jsonl.zst', '.bson.zst', '.json.zst')
 
-# Set up rich console
-console = Console()
+@lru_cache(maxsize=None)
+def _get_console():
+    """Build the rich console on first use."""
+    from rich.console import Console
+    return Console()
 
 def get_backups_dir() -> Path:
     """Get or create the backups directory."""
@@ -22,6 +35,8 @@ def get_backups_dir() -> Path:
 
 def select_backup_collection(collections_info: Dict[str, List[Tuple[str, int, int]]]) -> Tuple[str, str]:
     """Let user select which collection to backup."""
+    import questionary
+
     # Prepare all collections as choices
     choices = []
     for db_name, collections in collections_info.items():
@@ -50,6 +65,8 @@ def format_collection_choice(db_name: str, collection_info: Tuple[str, int, int]
 
 def get_backup_location() -> Path:
     """Get the backup location from user or use default."""
+    import questionary
+
     backups_dir = get_backups_dir()
     default_location = backups_dir / f"mongodb_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     
@@ -67,34 +84,132 @@ def get_backup_location() -> Path:
         
     return backup_path
 
+# Backup folder names carry their creation time; matching the digits with
+# one compiled pattern both rejects strangers at C speed and hands back a
+# sort key -- the fixed-width timestamp sorts lexicographically in time
+# order, so no strptime is needed to order thousands of folders.
+_BACKUP_FOLDER_RE = re.compile(r'mongodb_backup_(\d{8}_\d{6})$')
+
 def get_backup_folders():
     """Get all backup folders sorted by date (newest first)."""
     backups_dir = get_backups_dir()
-    backup_folders = [
-        d for d in backups_dir.iterdir()
-        if d.is_dir() and d.name.startswith('mongodb_backup_')
+    entries = [
+        (match.group(1), d)
+        for d in backups_dir.iterdir()
+        if (match := _BACKUP_FOLDER_RE.match(d.name)) and d.is_dir()
     ]
-    return sorted(backup_folders, reverse=True)
+    entries.sort(key=lambda entry: entry[0], reverse=True)
+    return [d for _, d in entries]
+
+# Folder summaries keyed by (path, root mtime). Backup folders are written
+# once -- the run that creates them also creates their db subdirectories, so
+# the root mtime pins the contents well enough to reuse summaries across
+# wizard invocations.
+_scan_cache = {}
+
+@lru_cache(maxsize=None)
+def _indexed_summaries(backups_dir: str, index_mtime_ns: int):
+    """Load the SQLite index once per (directory, index mtime)."""
+    return _backup_index.load_summaries(Path(backups_dir))
+
+def _index_summary(folder) -> Tuple[int, int, int]:
+    """Look a folder up in the backups index, or None if not indexed.
+
+    The whole index loads in one query and is cached on its mtime, so a
+    menu of N folders costs one read instead of N manifest opens.
+    """
+    parent = Path(folder).parent
+    try:
+        index_mtime = os.stat(parent / _backup_index.INDEX_NAME).st_mtime_ns
+    except OSError:
+        return None
+    return _indexed_summaries(str(parent), index_mtime).get(Path(folder).name)
+
+def _manifest_summary(folder) -> Tuple[int, int, int]:
+    """Summarize a backup folder from its manifest, or None if absent.
+
+    The manifest written at backup time answers in one small-file read
+    instead of a stat per collection file; corrupt or missing manifests
+    fall back to the walk.
+    """
+    try:
+        with open(Path(folder) / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+        entries = [entry for collections in manifest.values()
+                   for entry in collections]
+        return len(manifest), len(entries), sum(entry[2] for entry in entries)
+    except Exception:
+        return None
+
+def _scan_backup_folder(folder) -> Tuple[int, int, int]:
+    """Summarize a backup folder: index, then manifest, then a scandir walk.
+
+    Returns (db_count, collection_count, total_size). On the walk path,
+    DirEntry objects carry cached stat results, so the summary costs one
+    pass and one stat syscall per collection file instead of separate
+    rglob walks for counting and sizing. Results are cached per
+    (folder, mtime).
+    """
+    cache_key = (str(folder), os.stat(folder).st_mtime_ns)
+    cached = _scan_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    summary = _index_summary(folder)
+    if summary is None:
+        summary = _manifest_summary(folder)
+    if summary is not None:
+        _scan_cache[cache_key] = summary
+        return summary
+
+    db_count = collection_count = total_size = 0
+    with os.scandir(folder) as it:
+        stack = [entry.path for entry in it if entry.is_dir()]
+    db_count = len(stack)
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif (entry.name.endswith(BACKUP_FILE_SUFFIXES)
+                        and not entry.name.endswith(('.meta.json', '.metadata.json'))):
+                    collection_count += 1
+                    total_size += entry.stat().st_size
+
+    _scan_cache[cache_key] = (db_count, collection_count, total_size)
+    return db_count, collection_count, total_size
+
+def record_backup_summary(backup_folder) -> None:
+    """Record a finished backup in the folder index (best effort)."""
+    _backup_index.record_backup(backup_folder, _scan_backup_folder(backup_folder))
+
+# Every menu row shares this shape; binding format_map once at import skips
+# rebuilding the format per folder in long listings
+_CHOICE_TEMPLATE = '{timestamp} ({db_count} DBs, {collection_count} collections, {size})'.format_map
 
 def format_backup_choice(folder):
     """Format backup folder for selection menu with additional info."""
+    import humanize
+
     try:
         # Parse the timestamp from folder name
         timestamp = datetime.strptime(folder.name.replace('mongodb_backup_', ''), '%Y%m%d_%H%M%S')
-        
-        # Count databases and collections
-        db_count = sum(1 for x in folder.iterdir() if x.is_dir())
-        collection_count = sum(1 for x in folder.rglob("*.json"))
-        
-        # Calculate total size
-        total_size = sum(f.stat().st_size for f in folder.rglob("*.json"))
-        
-        return f"{timestamp.strftime('%Y-%m-%d %H:%M:%S')} ({db_count} DBs, {collection_count} collections, {humanize.naturalsize(total_size)})"
+
+        db_count, collection_count, total_size = _scan_backup_folder(folder)
+
+        return _CHOICE_TEMPLATE({
+            'timestamp': timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+            'db_count': db_count,
+            'collection_count': collection_count,
+            'size': humanize.naturalsize(total_size),
+        })
     except Exception as e:
         return str(folder)
 
 def select_restore_collection(collections_info: Dict[str, List[Tuple[str, int, int]]]) -> Tuple[str, str]:
     """Let user select which collection to restore."""
+    import questionary
+
     choices = []
     for db_name, collections in collections_info.items():
         for collection_info in collections:
@@ -113,6 +228,7 @@ def select_restore_collection(collections_info: Dict[str, List[Tuple[str, int, i
 
 def run_backup_wizard(client):
     """Run the interactive backup wizard."""
+    console = _get_console()
     try:
         # Get collections info
         collections_info = get_source_collections_info(client)
@@ -131,6 +247,8 @@ def run_backup_wizard(client):
         # Perform backup
         console.print(f"\nBacking up {db_name}.{collection_name} to {backup_path}")
         if backup_collection(client, db_name, collection_name, backup_path):
+            write_manifest(backup_path)
+            record_backup_summary(backup_path)
             console.print("[green]Backup completed successfully![/green]")
             return True
         else:
@@ -143,6 +261,9 @@ def run_backup_wizard(client):
 
 def run_restore_wizard(client):
     """Run the interactive restore wizard."""
+    import questionary
+
+    console = _get_console()
     try:
         # Get available backups
         backup_folders = get_backup_folders()
@@ -0,0 +1,53 @@
+"""Opt-in benchmarks for the backup path.
+
+Not part of the default suite: pytest-benchmark is deliberately not in
+requirements.txt, so these importorskip out of a normal run. To use
+them, ``pip install pytest-benchmark`` and run ``pytest tests/bench``
+with a Docker daemon available for the MongoDB container. Each run
+records CPU seconds alongside pytest-benchmark's wall time, so comparing
+the two classifies the backup loop as compute- or I/O-bound before any
+further tuning.
+"""
+
+import shutil
+import time
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+from testcontainers.mongodb import MongoDbContainer
+
+from mongowiz.core.backup import backup_collection
+
+@pytest.fixture(scope="module")
+def mongodb_container():
+    """Start MongoDB container for benchmarking."""
+    with MongoDbContainer() as container:
+        yield container
+
+@pytest.fixture(scope="module")
+def mongodb_client(mongodb_container):
+    """Get MongoDB client for benchmarking."""
+    return mongodb_container.get_connection_client()
+
+@pytest.mark.parametrize("doc_count", [10_000, 100_000])
+def test_backup_collection_bench(benchmark, tmp_path, mongodb_client, doc_count):
+    """Benchmark backup_collection over synthetic collections."""
+    db = mongodb_client["bench_db"]
+    collection = db[f"bench_{doc_count}"]
+    collection.insert_many([{"i": i, "v": "x" * 256} for i in range(doc_count)])
+
+    backup_dir = tmp_path / "backup"
+
+    def run():
+        cpu_before = time.process_time()
+        wall_before = time.perf_counter()
+        assert backup_collection(mongodb_client, "bench_db", collection.name, backup_dir)
+        benchmark.extra_info["cpu_seconds"] = time.process_time() - cpu_before
+        benchmark.extra_info["wall_seconds"] = time.perf_counter() - wall_before
+        shutil.rmtree(backup_dir)
+
+    try:
+        benchmark.pedantic(run, rounds=3)
+    finally:
+        collection.drop()
@@ -0,0 +1,57 @@
+"""Shared fixtures for core backup/restore tests.
+
+The MongoDB testcontainer is session-scoped: one container boot serves
+the whole run instead of one per test module. Tests drop whatever
+collections they create, which keeps the shared instance isolated.
+"""
+
+import pytest
+from bson import ObjectId
+from datetime import datetime
+from testcontainers.mongodb import MongoDbContainer
+
+@pytest.fixture(scope="session")
+def mongodb_container():
+    """Start MongoDB container for testing."""
+    with MongoDbContainer() as container:
+        yield container
+
+@pytest.fixture(scope="session")
+def mongodb_client(mongodb_container):
+    """Get MongoDB client for testing."""
+    return mongodb_container.get_connection_client()
+
+@pytest.fixture
+def test_data():
+    """Sample test data."""
+    return [
+        {"_id": "1", "name": "Test 1", "value": 100},
+        {"_id": "2", "name": "Test 2", "value": 200},
+        {"_id": "3", "name": "Test 3", "value": 300},
+    ]
+
+@pytest.fixture
+def complex_test_data():
+    """Test data with various MongoDB data types."""
+    return [
+        {
+            "_id": ObjectId(),
+            "name": "Complex 1",
+            "created_at": datetime.utcnow(),
+            "tags": ["tag1", "tag2"],
+            "nested": {"key": "value"},
+            "number_types": {
+                "int": 42,
+                "float": 3.14,
+                "decimal": 10.99
+            }
+        },
+        {
+            "_id": ObjectId(),
+            "name": "Complex 2",
+            "array_with_nulls": [1, None, 3],
+            "empty_array": [],
+            "empty_object": {},
+            "null_field": None
+        }
+    ]
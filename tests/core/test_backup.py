@@ -1,66 +1,24 @@
 """Tests for MongoDB backup operations."""
 
 import json
-from pathlib import Path
+from unittest.mock import MagicMock
 import pytest
-from bson import ObjectId
-from datetime import datetime
-from testcontainers.mongodb import MongoDbContainer
-from mongowiz.core.backup import backup_collection, get_collections_info
+from bson import encode
+from bson.raw_bson import RawBSONDocument
+from mongowiz.core.backup import (backup_all_collections, backup_collection,
+                                  encode_document, get_collections_info)
 from pymongo import MongoClient
 
-@pytest.fixture(scope="module")
-def mongodb_container():
-    """Start MongoDB container for testing."""
-    with MongoDbContainer() as container:
-        yield container
-
-@pytest.fixture(scope="module")
-def mongodb_client(mongodb_container):
-    """Get MongoDB client for testing."""
-    return mongodb_container.get_connection_client()
-
-@pytest.fixture
-def test_data():
-    """Sample test data."""
-    return [
-        {"_id": "1", "name": "Test 1", "value": 100},
-        {"_id": "2", "name": "Test 2", "value": 200},
-        {"_id": "3", "name": "Test 3", "value": 300},
-    ]
-
-@pytest.fixture
-def complex_test_data():
-    """Test data with various MongoDB data types."""
-    return [
-        {
-            "_id": ObjectId(),
-            "name": "Complex 1",
-            "created_at": datetime.utcnow(),
-            "tags": ["tag1", "tag2"],
-            "nested": {"key": "value"},
-            "number_types": {
-                "int": 42,
-                "float": 3.14,
-                "decimal": 10.99
-            }
-        },
-        {
-            "_id": ObjectId(),
-            "name": "Complex 2",
-            "array_with_nulls": [1, None, 3],
-            "empty_array": [],
-            "empty_object": {},
-            "null_field": None
-        }
-    ]
+def _insert_raw(collection, docs):
+    """Insert pre-encoded documents, skipping pymongo's per-field encode."""
+    collection.insert_many([RawBSONDocument(encode(doc)) for doc in docs])
 
 @pytest.fixture
 def setup_test_collection(mongodb_client, test_data):
     """Set up test collection with sample data."""
     db = mongodb_client["test_db"]
     collection = db["test_collection"]
-    collection.insert_many(test_data)
+    _insert_raw(collection, test_data)
     yield collection
     collection.drop()
 
@@ -69,7 +27,7 @@ def setup_complex_collection(mongodb_client, complex_test_data):
     """Set up test collection with complex data types."""
     db = mongodb_client["test_db"]
     collection = db["complex_collection"]
-    collection.insert_many(complex_test_data)
+    _insert_raw(collection, complex_test_data)
     yield collection
     collection.drop()
 
@@ -117,15 +75,21 @@ def test_backup_collection(tmp_path, mongodb_client, setup_test_collection):
     assert result is True
     
     # Verify backup file exists
-    backup_file = backup_dir / "test_db" / "test_collection.json"
+    backup_file = backup_dir / "test_db" / "test_collection.jsonl"
     assert backup_file.exists()
     
-    # Verify backup contents
+    # Verify backup contents (one JSON document per line)
     with open(backup_file) as f:
-        backed_up_data = json.load(f)
+        backed_up_data = [json.loads(line) for line in f]
     assert len(backed_up_data) == 3
     assert all(doc["name"].startswith("Test ") for doc in backed_up_data)
 
+    # A .meta.json sidecar records the document count for fast listings
+    meta_file = backup_dir / "test_db" / "test_collection.meta.json"
+    assert meta_file.exists()
+    with open(meta_file) as f:
+        assert json.load(f)["count"] == 3
+
 def test_backup_empty_collection(tmp_path, mongodb_client):
     """Test backing up an empty collection."""
     # Create empty collection
@@ -138,12 +102,11 @@ def test_backup_empty_collection(tmp_path, mongodb_client):
         result = backup_collection(mongodb_client, "test_db", "empty_collection", backup_dir)
         assert result is True
         
-        # Verify backup file exists and contains empty array
-        backup_file = backup_dir / "test_db" / "empty_collection.json"
+        # Verify backup file exists and contains no documents
+        backup_file = backup_dir / "test_db" / "empty_collection.jsonl"
         assert backup_file.exists()
         with open(backup_file) as f:
-            backed_up_data = json.load(f)
-        assert isinstance(backed_up_data, list)
+            backed_up_data = [json.loads(line) for line in f]
         assert len(backed_up_data) == 0
     finally:
         # Clean up
@@ -157,21 +120,19 @@ def test_backup_complex_data_types(tmp_path, mongodb_client, setup_complex_colle
     assert result is True
     
     # Verify backup file exists
-    backup_file = backup_dir / "test_db" / "complex_collection.json"
+    backup_file = backup_dir / "test_db" / "complex_collection.jsonl"
     assert backup_file.exists()
     
     # Verify backup contents
     with open(backup_file) as f:
-        backed_up_data = json.load(f)
+        backed_up_data = [json.loads(line) for line in f]
     
     assert len(backed_up_data) == 2
     
-    # Check first document
+    # Check first document (MongoDB relaxed Extended JSON)
     doc1 = backed_up_data[0]
-    assert doc1["_id"]["$type"] == "ObjectId"
-    assert isinstance(doc1["_id"]["$value"], str)
-    assert doc1["created_at"]["$type"] == "datetime"
-    assert isinstance(doc1["created_at"]["$value"], str)
+    assert isinstance(doc1["_id"]["$oid"], str)
+    assert "$date" in doc1["created_at"]
     assert isinstance(doc1["tags"], list)
     assert isinstance(doc1["nested"], dict)
     assert isinstance(doc1["number_types"], dict)
@@ -183,6 +144,40 @@ def test_backup_complex_data_types(tmp_path, mongodb_client, setup_complex_colle
     assert len(doc2["empty_object"]) == 0
     assert doc2["null_field"] is None
 
+def test_encode_document_nonfinite_floats():
+    """Test that NaN/Infinity doubles survive encoding instead of becoming null."""
+    data = encode_document({
+        "nan": float("nan"),
+        "inf": float("inf"),
+        "neg_inf": float("-inf"),
+        "null_field": None,
+    })
+
+    decoded = json.loads(data)
+    assert decoded["nan"] == {"$numberDouble": "NaN"}
+    assert decoded["inf"] == {"$numberDouble": "Infinity"}
+    assert decoded["neg_inf"] == {"$numberDouble": "-Infinity"}
+    assert decoded["null_field"] is None
+
+def test_backup_autotuned_batch_size(tmp_path):
+    """Test that the cursor batch_size is tuned from average document size."""
+    client = MagicMock()
+    db = client["test_db"]
+    db.list_collection_names.return_value = ["test_collection"]
+    collection = db["test_collection"]
+    collection.aggregate.return_value = iter(
+        [{"storageStats": {"count": 1000, "size": 500_000}}]
+    )
+    collection.estimated_document_count.return_value = 1000
+    collection.find.return_value = []
+
+    backup_dir = tmp_path / "backup"
+    result = backup_collection(client, "test_db", "test_collection", backup_dir)
+    assert result is True
+
+    # 500 bytes/doc on average -> ~1 MB per getMore reply -> 2000 docs/batch
+    assert collection.find.call_args.kwargs["batch_size"] == 2000
+
 def test_backup_nonexistent_collection(tmp_path, mongodb_client):
     """Test attempting to backup a collection that doesn't exist."""
     backup_dir = tmp_path / "backup"
@@ -190,20 +185,17 @@ def test_backup_nonexistent_collection(tmp_path, mongodb_client):
     assert result is False
     
     # Verify no backup file was created
-    backup_file = backup_dir / "test_db" / "nonexistent_collection.json"
+    backup_file = backup_dir / "test_db" / "nonexistent_collection.jsonl"
     assert not backup_file.exists()
 
-def test_backup_with_invalid_path(mongodb_client, setup_test_collection):
+def test_backup_with_invalid_path(tmp_path, mongodb_client, setup_test_collection):
     """Test backup with invalid backup path."""
     # Try to backup to a file path instead of directory
-    with open("invalid_path.txt", "w") as f:
-        f.write("test")
-    
-    result = backup_collection(mongodb_client, "test_db", "test_collection", Path("invalid_path.txt"))
+    invalid_path = tmp_path / "invalid_path.txt"
+    invalid_path.write_text("test")
+
+    result = backup_collection(mongodb_client, "test_db", "test_collection", invalid_path)
     assert result is False
-    
-    # Clean up
-    Path("invalid_path.txt").unlink()
 
 def test_get_collections_info(mongodb_client, setup_test_collection):
     """Test getting collection information from MongoDB."""
@@ -222,6 +214,30 @@ def test_get_collections_info(mongodb_client, setup_test_collection):
     assert test_coll_info[1] == 3  # doc count
     assert test_coll_info[2] > 0  # size
 
+def test_backup_parallel_all_collections(tmp_path, mongodb_container, mongodb_client, test_data):
+    """Test backing up multiple collections through the process pool."""
+    db = mongodb_client["test_db"]
+    names = ["parallel_a", "parallel_b", "parallel_c"]
+    for name in names:
+        db[name].insert_many([dict(doc) for doc in test_data])
+
+    try:
+        collections_info = {"test_db": [(name, 3, 1) for name in names]}
+        backup_dir = tmp_path / "backup"
+        result = backup_all_collections(
+            mongodb_container.get_connection_url(), collections_info,
+            backup_dir, workers=3)
+        assert result is True
+
+        for name in names:
+            backup_file = backup_dir / "test_db" / f"{name}.jsonl"
+            assert backup_file.exists()
+            with open(backup_file) as f:
+                assert len([json.loads(line) for line in f]) == 3
+    finally:
+        for name in names:
+            db[name].drop()
+
 def test_backup_with_limited_permissions(tmp_path, mongodb_limited_user):
     """Test that backup works with minimal (read-only) permissions."""
     try:
@@ -231,11 +247,11 @@ def test_backup_with_limited_permissions(tmp_path, mongodb_limited_user):
         assert result is True
         
         # Verify backup file exists and contains data
-        backup_file = backup_dir / "test_db" / "test_collection.json"
+        backup_file = backup_dir / "test_db" / "test_collection.jsonl"
         assert backup_file.exists()
         
         with open(backup_file) as f:
-            backed_up_data = json.load(f)
+            backed_up_data = [json.loads(line) for line in f]
         
         assert len(backed_up_data) == 1
         assert backed_up_data[0]["test"] == "data"
@@ -2,57 +2,13 @@
 
 import json
 from pathlib import Path
+from unittest.mock import MagicMock
 import pytest
 from bson import ObjectId
 from datetime import datetime
-from testcontainers.mongodb import MongoDbContainer
+from mongowiz.core.backup import backup_collection, backup_collection_parallel
 from mongowiz.core.restore import restore_collection, get_collections_info, RestoreError
-
-@pytest.fixture(scope="module")
-def mongodb_container():
-    """Start MongoDB container for testing."""
-    with MongoDbContainer() as container:
-        yield container
-
-@pytest.fixture(scope="module")
-def mongodb_client(mongodb_container):
-    """Get MongoDB client for testing."""
-    return mongodb_container.get_connection_client()
-
-@pytest.fixture
-def test_data():
-    """Sample test data."""
-    return [
-        {"_id": "1", "name": "Test 1", "value": 100},
-        {"_id": "2", "name": "Test 2", "value": 200},
-        {"_id": "3", "name": "Test 3", "value": 300},
-    ]
-
-@pytest.fixture
-def complex_test_data():
-    """Test data with various MongoDB data types."""
-    return [
-        {
-            "_id": ObjectId(),
-            "name": "Complex 1",
-            "created_at": datetime.utcnow(),
-            "tags": ["tag1", "tag2"],
-            "nested": {"key": "value"},
-            "number_types": {
-                "int": 42,
-                "float": 3.14,
-                "decimal": 10.99
-            }
-        },
-        {
-            "_id": ObjectId(),
-            "name": "Complex 2",
-            "array_with_nulls": [1, None, 3],
-            "empty_array": [],
-            "empty_object": {},
-            "null_field": None
-        }
-    ]
+from mongowiz.core.restore import _insert_documents
 
 @pytest.fixture
 def backup_dir(tmp_path, test_data):
@@ -61,10 +17,11 @@ def backup_dir(tmp_path, test_data):
     db_dir = backup_dir / "test_db"
     db_dir.mkdir(parents=True)
     
-    # Create backup file
-    backup_file = db_dir / "test_collection.json"
+    # Create backup file (JSON Lines: one document per line)
+    backup_file = db_dir / "test_collection.jsonl"
     with open(backup_file, "w") as f:
-        json.dump(test_data, f)
+        for doc in test_data:
+            f.write(json.dumps(doc) + "\n")
     
     return backup_dir
 
@@ -76,9 +33,10 @@ def complex_backup_dir(tmp_path, complex_test_data):
     db_dir.mkdir(parents=True)
     
     # Create backup file
-    backup_file = db_dir / "complex_collection.json"
+    backup_file = db_dir / "complex_collection.jsonl"
     with open(backup_file, "w") as f:
-        json.dump(complex_test_data, f, default=str)  # Use str for ObjectId and datetime
+        for doc in complex_test_data:
+            f.write(json.dumps(doc, default=str) + "\n")  # Use str for ObjectId and datetime
     
     return backup_dir
 
@@ -130,12 +88,12 @@ def test_restore_existing_collection(mongodb_client, backup_dir, test_data):
 
 def test_restore_complex_data_types(mongodb_client, complex_backup_dir):
     """Test restoring a collection with complex MongoDB data types."""
-    # Create test data
+    # Create test data in relaxed Extended JSON (the current backup format)
     test_data = [
         {
-            "_id": {"$type": "ObjectId", "$value": str(ObjectId())},
+            "_id": {"$oid": str(ObjectId())},
             "name": "Complex 1",
-            "created_at": {"$type": "datetime", "$value": datetime.now().isoformat()},
+            "created_at": {"$date": datetime.now().isoformat(timespec="milliseconds") + "Z"},
             "tags": ["tag1", "tag2"],
             "nested": {"key": "value"},
             "number_types": {
@@ -145,7 +103,7 @@ def test_restore_complex_data_types(mongodb_client, complex_backup_dir):
             }
         },
         {
-            "_id": {"$type": "ObjectId", "$value": str(ObjectId())},
+            "_id": {"$oid": str(ObjectId())},
             "name": "Complex 2",
             "array_with_nulls": [1, None, 3],
             "empty_array": [],
@@ -157,9 +115,10 @@ def test_restore_complex_data_types(mongodb_client, complex_backup_dir):
     # Create backup file
     backup_dir = complex_backup_dir / "test_db"
     backup_dir.mkdir(parents=True, exist_ok=True)
-    backup_file = backup_dir / "complex_collection.json"
+    backup_file = backup_dir / "complex_collection.jsonl"
     with open(backup_file, "w") as f:
-        json.dump(test_data, f)
+        for doc in test_data:
+            f.write(json.dumps(doc) + "\n")
     
     # Perform restore
     result = restore_collection(mongodb_client, complex_backup_dir, "test_db", "complex_collection")
@@ -192,6 +151,123 @@ def test_restore_complex_data_types(mongodb_client, complex_backup_dir):
     # Clean up
     collection.drop()
 
+def test_restore_compressed_round_trip(mongodb_client, tmp_path, test_data):
+    """Test a full backup/restore round trip with zstd compression."""
+    db = mongodb_client["test_db"]
+    collection = db["zstd_collection"]
+    collection.insert_many([dict(doc) for doc in test_data])
+
+    try:
+        backup_dir = tmp_path / "backup"
+        assert backup_collection(mongodb_client, "test_db", "zstd_collection",
+                                 backup_dir, compress=True) is True
+        assert (backup_dir / "test_db" / "zstd_collection.jsonl.zst").exists()
+
+        collection.drop()
+        assert restore_collection(mongodb_client, backup_dir, "test_db",
+                                  "zstd_collection") is True
+
+        restored_docs = list(collection.find({}))
+        assert len(restored_docs) == 3
+        assert all(doc["name"].startswith("Test ") for doc in restored_docs)
+    finally:
+        collection.drop()
+
+def test_restore_bson_round_trip(mongodb_client, tmp_path, complex_test_data):
+    """Test a full backup/restore round trip in raw BSON format."""
+    db = mongodb_client["test_db"]
+    collection = db["bson_collection"]
+    collection.insert_many([dict(doc) for doc in complex_test_data])
+
+    try:
+        backup_dir = tmp_path / "backup"
+        assert backup_collection(mongodb_client, "test_db", "bson_collection",
+                                 backup_dir, output_format='bson') is True
+        assert (backup_dir / "test_db" / "bson_collection.bson").exists()
+
+        collection.drop()
+        assert restore_collection(mongodb_client, backup_dir, "test_db",
+                                  "bson_collection") is True
+
+        # BSON round-trips MongoDB types natively, no Extended JSON pass
+        restored_docs = list(collection.find({}))
+        assert len(restored_docs) == 2
+        doc1 = next(doc for doc in restored_docs if doc["name"] == "Complex 1")
+        assert isinstance(doc1["_id"], ObjectId)
+        assert isinstance(doc1["created_at"], datetime)
+    finally:
+        collection.drop()
+
+def test_restore_parallel_workers_round_trip(mongodb_client, tmp_path):
+    """Test that a workers=2 backup stitches a file that restores completely."""
+    db = mongodb_client["test_db"]
+    collection = db["parallel_collection"]
+    collection.insert_many([{"_id": i, "value": i} for i in range(500)])
+
+    try:
+        backup_dir = tmp_path / "backup"
+        assert backup_collection(mongodb_client, "test_db", "parallel_collection",
+                                 backup_dir, workers=2) is True
+        assert (backup_dir / "test_db" / "parallel_collection.jsonl").exists()
+
+        collection.drop()
+        assert restore_collection(mongodb_client, backup_dir, "test_db",
+                                  "parallel_collection") is True
+
+        assert collection.count_documents({}) == 500
+    finally:
+        collection.drop()
+
+def test_restore_parallel_compressed_multi_frame(mongodb_client, tmp_path):
+    """Test restoring a parallel compressed backup (one zstd frame per worker)."""
+    db = mongodb_client["test_db"]
+    collection = db["multi_frame_collection"]
+    collection.insert_many([{"_id": i, "value": i} for i in range(500)])
+
+    try:
+        backup_dir = tmp_path / "backup"
+        assert backup_collection_parallel(mongodb_client, "test_db",
+                                          "multi_frame_collection", backup_dir,
+                                          workers=2, compress=True) is True
+        assert (backup_dir / "test_db" / "multi_frame_collection.jsonl.zst").exists()
+
+        collection.drop()
+        assert restore_collection(mongodb_client, backup_dir, "test_db",
+                                  "multi_frame_collection") is True
+
+        # The stitched file is several concatenated frames; the restore
+        # must read across all of them
+        assert collection.count_documents({}) == 500
+    finally:
+        collection.drop()
+
+def test_restore_legacy_type_tags(mongodb_client, tmp_path):
+    """Test restoring a legacy backup: single-array .json with $type/$value tags."""
+    test_data = [
+        {
+            "_id": {"$type": "ObjectId", "$value": str(ObjectId())},
+            "name": "Legacy 1",
+            "created_at": {"$type": "datetime", "$value": datetime.now().isoformat()},
+        }
+    ]
+
+    backup_dir = tmp_path / "backup"
+    db_dir = backup_dir / "test_db"
+    db_dir.mkdir(parents=True)
+    with open(db_dir / "legacy_collection.json", "w") as f:
+        json.dump(test_data, f)
+
+    result = restore_collection(mongodb_client, backup_dir, "test_db", "legacy_collection")
+    assert result is True
+
+    collection = mongodb_client["test_db"]["legacy_collection"]
+    doc = collection.find_one()
+    assert isinstance(doc["_id"], ObjectId)
+    assert isinstance(doc["created_at"], datetime)
+
+    # Clean up
+    collection.drop()
+
 def test_restore_from_invalid_backup(mongodb_client, tmp_path):
     """Test restoring from an invalid backup file."""
     # Create an invalid backup file
@@ -199,7 +275,7 @@ def test_restore_from_invalid_backup(mongodb_client, tmp_path):
     db_dir = backup_dir / "test_db"
     db_dir.mkdir(parents=True)
     
-    backup_file = db_dir / "test_collection.json"
+    backup_file = db_dir / "test_collection.jsonl"
     with open(backup_file, "w") as f:
         f.write("invalid json")
     
@@ -207,6 +283,23 @@ def test_restore_from_invalid_backup(mongodb_client, tmp_path):
     result = restore_collection(mongodb_client, backup_dir, "test_db", "test_collection")
     assert result is False
 
+def test_restore_unordered_batching(tmp_path):
+    """Test that restore inserts in unordered insert_many batches."""
+    target = MagicMock()
+    pbar = MagicMock()
+    documents = ({"_id": i, "value": i} for i in range(2500))
+
+    inserted = _insert_documents(target, documents, pbar, batch_size=1000)
+    assert inserted == 2500
+
+    # 2500 docs at 1000/batch -> exactly three insert_many calls, all unordered
+    assert target.insert_many.call_count == 3
+    # Batches run on pool threads, so compare sizes order-independently
+    batches = [call.args[0] for call in target.insert_many.call_args_list]
+    assert sorted(len(batch) for batch in batches) == [500, 1000, 1000]
+    assert all(call.kwargs["ordered"] is False
+               for call in target.insert_many.call_args_list)
+
 def test_restore_from_nonexistent_backup(mongodb_client, tmp_path):
     """Test restoring from a nonexistent backup file."""
     backup_dir = tmp_path / "backup"
@@ -215,14 +308,13 @@ def test_restore_from_nonexistent_backup(mongodb_client, tmp_path):
 
 def test_restore_empty_collection(mongodb_client, tmp_path):
     """Test restoring an empty collection."""
-    # Create backup with empty array
+    # Create a backup file with no documents
     backup_dir = tmp_path / "backup"
     db_dir = backup_dir / "test_db"
     db_dir.mkdir(parents=True)
     
-    backup_file = db_dir / "empty_collection.json"
-    with open(backup_file, "w") as f:
-        json.dump([], f)
+    backup_file = db_dir / "empty_collection.jsonl"
+    backup_file.touch()
     
     # Perform restore
     result = restore_collection(mongodb_client, backup_dir, "test_db", "empty_collection")
@@ -64,8 +64,40 @@ def test_get_backup_folders(tmp_path):
         assert backup_folders[0].name == folders[0]
         assert backup_folders[-1].name == folders[-1]
 
+def test_format_backup_choice_from_index(tmp_path):
+    """Test that folder summaries come from the SQLite index when recorded."""
+    from mongowiz.ui._backup_index import record_backup
+
+    backup_folder = tmp_path / "mongodb_backup_20250123_120000"
+    backup_folder.mkdir(parents=True)
+    record_backup(backup_folder, (3, 5, 4096))
+
+    choice_text = format_backup_choice(backup_folder)
+
+    assert "2025-01-23 12:00:00" in choice_text
+    assert "3 DBs" in choice_text
+    assert "5 collections" in choice_text
+
+def test_format_backup_choice_from_manifest(tmp_path):
+    """Test that folder summaries come from the manifest when present."""
+    backup_folder = tmp_path / "mongodb_backup_20250123_120000"
+    backup_folder.mkdir(parents=True)
+
+    manifest = {
+        "db1": [["coll1", 100, 1024], ["coll2", 200, 2048]],
+        "db2": [["coll3", 300, 4096]],
+    }
+    with open(backup_folder / "manifest.json", "w") as f:
+        json.dump(manifest, f)
+
+    choice_text = format_backup_choice(backup_folder)
+
+    assert "2025-01-23 12:00:00" in choice_text
+    assert "2 DBs" in choice_text
+    assert "3 collections" in choice_text
+
 def test_format_backup_choice(tmp_path):
-    """Test formatting backup folder for display."""
+    """Test formatting a backup folder with no manifest (filesystem fallback)."""
     backup_folder = tmp_path / "mongodb_backup_20250123_120000"
     backup_folder.mkdir(parents=True)
     